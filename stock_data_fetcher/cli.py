@@ -3,16 +3,20 @@ import argparse
 import sys
 import pathlib
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 
-from .utils import normalize_symbols, parse_date, format_date_for_filename
+import pandas as pd
+
+from .utils import normalize_symbols, parse_date, format_date_for_filename, is_tw_trading_day
 from .fetcher import fetch_history, select_columns
-from .writer import write_symbol_frames, generate_filename
+from .writer import write_symbol_frames, ensure_dir, write_csv
 from .exceptions import ValidationError, DownloadError, OutputError
 
 # TWSE fetchers and merger
 from .institutional_fetcher import collect_t86
 from .daytrade_fetcher import collect_daytrade
-from .merger import merge_price_institution_daytrade
+from .merger import merge_price_institution_daytrade, build_code_index
+from .twse_api import close_session, DEFAULT_MAX_WORKERS, DEFAULT_TIMEOUT, MIN_REQUEST_INTERVAL
 
 # ---------------------------------------------------------------------------
 # Simple licensing policy (extendable)
@@ -38,6 +42,27 @@ def check_license(provider: str, use_case: str) -> None:
             "See TWSE terms or modify the policy matrix if you possess a licence."
         )
 
+def _price_frame_for(data: pd.DataFrame, symbol: str) -> pd.DataFrame | None:
+    """Slice one symbol out of the downloaded price frame, with the date index as a 'Date' column."""
+    if isinstance(data.columns, pd.MultiIndex):
+        if symbol not in data.columns.get_level_values(0):
+            return None
+        sub = data.xs(symbol, level=0, axis=1)
+    else:
+        sub = data
+    return sub.rename_axis("Date").reset_index()
+
+
+def _write_merged(job: tuple[str, pd.DataFrame, pathlib.Path]) -> pathlib.Path:
+    """Write one merged frame; run on a worker thread since file writes release the GIL."""
+    symbol, merged_df, path = job
+    try:
+        write_csv(merged_df, path, index=False)
+    except Exception as e:
+        raise OutputError(f"Failed to write merged file for {symbol} to {path}: {e}") from e
+    return path
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="stock-data-fetcher",
@@ -59,8 +84,8 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--intended-use", default="private_research",
                         choices=["private_research", "redistribute", "commercial"],
                         help="Declare how you will use the data for a basic licence check.")
-    parser.add_argument("--file-format", default="csv", choices=["csv"],
-                        help="Output file format (currently only csv).")
+    parser.add_argument("--file-format", default="csv", choices=["csv", "parquet"],
+                        help="Output file format for per-symbol price files (parquet requires pyarrow).")
     parser.add_argument("--output-path", default="data",
                         help="Directory to store output files.")
     parser.add_argument("--columns", nargs="+",
@@ -80,6 +105,18 @@ def build_parser() -> argparse.ArgumentParser:
                         help="Fetch TWSE daytrade stats for the date range.")
     parser.add_argument("--merge-twse", action="store_true",
                         help="After fetch, merge Yahoo price and TWSE data by date per symbol and save as merged CSV.")
+    parser.add_argument("--merge-only", action="store_true",
+                        help="Write only the merged TWSE/Yahoo CSVs, skipping the plain per-symbol price files (implies --merge-twse).")
+    parser.add_argument("--twse-workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help="Number of concurrent TWSE requests when fetching a date range "
+                             f"(default: {DEFAULT_MAX_WORKERS}). Requests still start at most once every "
+                             f"{MIN_REQUEST_INTERVAL:g}s to avoid TWSE rate-limit blocks, so more workers only "
+                             "help when responses are slow.")
+    parser.add_argument("--twse-timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"Per-request timeout in seconds for TWSE calls (default: {DEFAULT_TIMEOUT}).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always re-download TWSE data, neither reading nor writing ~/.cache/stock-data-fetcher "
+                             "(per-date results and stored ETag responses).")
     return parser
 
 def main(argv: list[str] | None = None) -> int:
@@ -94,6 +131,8 @@ def main(argv: list[str] | None = None) -> int:
         end = parse_date(args.end_date) if args.end_date else None
         if end and end < start:
             raise ValidationError("end-date must be >= start-date.")
+        if args.merge_only and not (args.twse_t86 or args.twse_daytrade):
+            raise ValidationError("--merge-only requires --twse-t86 and/or --twse-daytrade.")
     except ValidationError as ve:
         print(f"[ValidationError] {ve}", file=sys.stderr)
         return 2
@@ -127,15 +166,20 @@ def main(argv: list[str] | None = None) -> int:
         return 3
 
     output_dir = pathlib.Path(args.output_path)
+    merge_twse = args.merge_twse or args.merge_only
     try:
-        written = write_symbol_frames(
-            df=data,
-            symbols=symbols,
-            output_dir=output_dir,
-            start=start,
-            end=end,
-            file_format=args.file_format
-        )
+        if args.merge_only:
+            ensure_dir(output_dir)
+            written = []
+        else:
+            written = write_symbol_frames(
+                df=data,
+                symbols=symbols,
+                output_dir=output_dir,
+                start=start,
+                end=end,
+                file_format=args.file_format
+            )
     except OutputError as oe:
         print(f"[OutputError] {oe}", file=sys.stderr)
         return 4
@@ -145,42 +189,60 @@ def main(argv: list[str] | None = None) -> int:
 
     # 2. Optionally fetch TWSE data (T86 / daytrade)
     date_range = []
-    if args.twse_t86 or args.twse_daytrade or args.merge_twse:
-        if end:
-            n_days = (end - start).days + 1
-            date_range = [start + dt.timedelta(days=i) for i in range(n_days)]
-        else:
-            # If no end-date, fetch till today (inclusive)
-            today = dt.date.today()
-            n_days = (today - start).days + 1
-            date_range = [start + dt.timedelta(days=i) for i in range(n_days)]
+    if args.twse_t86 or args.twse_daytrade or merge_twse:
+        # If no end-date, fetch till today (inclusive)
+        last = end if end else dt.date.today()
+        n_days = (last - start).days + 1
+        # Skip weekends and known TWSE holidays instead of spending a request on an empty answer
+        date_range = [
+            d for d in (start + dt.timedelta(days=i) for i in range(n_days))
+            if is_tw_trading_day(d)
+        ]
     t86_df = None
     daytrade_df = None
-    if args.twse_t86:
-        t86_df = collect_t86(date_range)
-    if args.twse_daytrade:
-        daytrade_df = collect_daytrade(date_range)
+    try:
+        if args.twse_t86:
+            t86_df = collect_t86(
+                date_range, timeout=args.twse_timeout, max_workers=args.twse_workers, use_cache=not args.no_cache
+            )
+        if args.twse_daytrade:
+            daytrade_df = collect_daytrade(
+                date_range, timeout=args.twse_timeout, max_workers=args.twse_workers, use_cache=not args.no_cache
+            )
+    finally:
+        close_session()
 
     # 3. Optionally merge and write merged output
     merged_written = []
-    if args.merge_twse and (args.twse_t86 or args.twse_daytrade):
-        import pandas as pd
+    if merge_twse and (args.twse_t86 or args.twse_daytrade):
+        t86_by_code = build_code_index(t86_df)
+        daytrade_by_code = build_code_index(daytrade_df)
+        start_tag = format_date_for_filename(start)
+        end_tag = format_date_for_filename(end)
+        merge_jobs = []
         for symbol in symbols:
-            symbol_csv = output_dir / generate_filename(symbol, start, end, ext=args.file_format)
-            if not symbol_csv.exists():
-                print(f"[MergeWarning] Price file not found for symbol {symbol}: {symbol_csv}", file=sys.stderr)
+            price_df = _price_frame_for(data, symbol)
+            if price_df is None:
+                print(f"[MergeWarning] Price data not found for symbol {symbol}", file=sys.stderr)
                 continue
-            price_df = pd.read_csv(symbol_csv, parse_dates=["Date"])
             merged_df = merge_price_institution_daytrade(
                 price_df=price_df,
                 inst_df=t86_df,
                 daytrade_df=daytrade_df,
                 symbol=symbol,
-                date_col="Date"
+                date_col="Date",
+                inst_by_code=t86_by_code,
+                daytrade_by_code=daytrade_by_code,
             )
-            merged_file = output_dir / f"{symbol}_TWSE_MERGED_{format_date_for_filename(start)}_{format_date_for_filename(end)}.csv"
-            merged_df.to_csv(merged_file, index=False)
-            merged_written.append(merged_file)
+            merged_file = output_dir / f"{symbol}_TWSE_MERGED_{start_tag}_{end_tag}.csv"
+            merge_jobs.append((symbol, merged_df, merged_file))
+        if merge_jobs:
+            try:
+                with ThreadPoolExecutor(max_workers=min(8, len(merge_jobs))) as executor:
+                    merged_written = list(executor.map(_write_merged, merge_jobs))
+            except OutputError as oe:
+                print(f"[OutputError] {oe}", file=sys.stderr)
+                return 4
 
     # 4. Summary
     if args.show_summary:
@@ -1,9 +1,17 @@
 from __future__ import annotations
 import datetime as dt
-from typing import Iterable
+from typing import Iterable, Optional
 import pandas as pd
 
-from .twse_api import fetch_daytrade_single
+from .twse_api import (
+    fetch_daytrade_single,
+    fetch_dates,
+    normalize_codes,
+    to_int_columns,
+    tighten_dtypes,
+    DEFAULT_TIMEOUT,
+    DEFAULT_MAX_WORKERS,
+)
 
 DAYTRADE_COL_MAP = {
     "證券代號": "code",
@@ -15,13 +23,60 @@ DAYTRADE_COL_MAP = {
     "當日沖銷比率(%)": "daytrade_ratio_pct",
 }
 
+DAYTRADE_NUMERIC_COLS = ["daytrade_volume", "daytrade_buy_volume", "daytrade_sell_volume", "total_volume"]
 
-def collect_daytrade(dates: Iterable[dt.date], retry: int = 0, retry_wait: int = 3) -> pd.DataFrame:
-    """Collect day trading statistics across dates. Logs missing dates and coerces numerics safely."""
+# Storage dtypes applied after all dates are concatenated, so every date shares one category dictionary.
+DAYTRADE_SCHEMA = {"code": "category", "name": "category"}
+
+
+def _fetch_daytrade_typed(date: dt.date, **kwargs) -> Optional[pd.DataFrame]:
+    """
+    fetch_daytrade_single plus renaming and numeric coercion, done per date on the worker
+    threads so JSON and CSV-fallback frames reach collect_daytrade with one schema.
+    """
+    df = fetch_daytrade_single(date, **kwargs)
+    if df is None:
+        return None
+    df = df.rename(columns={k: v for k, v in DAYTRADE_COL_MAP.items() if k in df.columns})
+
+    # Ensure a single 'code' column exists
+    if "code" not in df.columns:
+        if "code_dt" in df.columns:
+            df.rename(columns={"code_dt": "code"}, inplace=True)
+        elif "證券代號" in df.columns:
+            df.rename(columns={"證券代號": "code"}, inplace=True)
+    normalize_codes(df)
+
+    # Safe numeric conversions
+    to_int_columns(df, DAYTRADE_NUMERIC_COLS)
+
+    if "daytrade_ratio_pct" in df.columns:
+        df["daytrade_ratio"] = pd.to_numeric(
+            df["daytrade_ratio_pct"].astype(str)
+                .str.replace(",", "", regex=False)
+                .str.replace("%", "", regex=False),
+            errors="coerce"
+        ) / 100.0
+
+    return df
+
+
+def collect_daytrade(
+    dates: Iterable[dt.date],
+    retry: int = 0,
+    retry_wait: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """Collect day trading statistics across dates concurrently. Logs missing dates and coerces numerics safely."""
     frames = []
     missing = []
-    for d in dates:
-        df = fetch_daytrade_single(d, retry=retry, retry_wait=retry_wait)
+    results = fetch_dates(
+        _fetch_daytrade_typed, dates, max_workers=max_workers,
+        retry=retry, retry_wait=retry_wait, timeout=timeout, use_cache=use_cache,
+    )
+    for d, df in results:
         if df is not None:
             frames.append(df)
         else:
@@ -32,29 +87,4 @@ def collect_daytrade(dates: Iterable[dt.date], retry: int = 0, retry_wait: int =
         return pd.DataFrame()
 
     dt_df = pd.concat(frames, ignore_index=True)
-    dt_df = dt_df.rename(columns={k: v for k, v in DAYTRADE_COL_MAP.items() if k in dt_df.columns})
-
-    # Ensure a single 'code' column exists
-    if "code" not in dt_df.columns:
-        if "code_dt" in dt_df.columns:
-            dt_df.rename(columns={"code_dt": "code"}, inplace=True)
-        elif "證券代號" in dt_df.columns:
-            dt_df.rename(columns={"證券代號": "code"}, inplace=True)
-
-    # Safe numeric conversions
-    for c in ["daytrade_volume", "daytrade_buy_volume", "daytrade_sell_volume", "total_volume"]:
-        if c in dt_df.columns:
-            dt_df[c] = pd.to_numeric(
-                dt_df[c].astype(str).str.replace(",", "", regex=False),
-                errors="coerce"
-            ).astype("Int64")
-
-    if "daytrade_ratio_pct" in dt_df.columns:
-        dt_df["daytrade_ratio"] = pd.to_numeric(
-            dt_df["daytrade_ratio_pct"].astype(str)
-                .str.replace(",", "", regex=False)
-                .str.replace("%", "", regex=False),
-            errors="coerce"
-        ) / 100.0
-
-    return dt_df
+    return tighten_dtypes(dt_df, DAYTRADE_SCHEMA)
@@ -1,11 +1,22 @@
 from __future__ import annotations
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 from typing import Sequence, Optional
 import yfinance as yf
 import pandas as pd
 
 from .exceptions import DownloadError
 
+# Yahoo rejects or silently truncates requests carrying many more tickers than this.
+YAHOO_MAX_SYMBOLS_PER_REQUEST = 20
+MAX_CHUNK_WORKERS = 8
+
+try:  # yfinance releases with per-call download state (multi._DownloadCtx) allow concurrent download()
+    from yfinance.multi import _DownloadCtx  # noqa: F401
+    CONCURRENT_DOWNLOADS = True
+except ImportError:  # older releases reset and fill module-global shared._DFS/_ERRORS on every call
+    CONCURRENT_DOWNLOADS = False
+
 
 def fetch_history(
     symbols: Sequence[str],
@@ -24,10 +35,10 @@ def fetch_history(
     Notes:
       - yfinance treats 'end' as exclusive; we add +1 day to make it inclusive logically.
       - Supports multi-ticker download for efficiency.
+      - More than YAHOO_MAX_SYMBOLS_PER_REQUEST symbols are split into concurrent chunked requests.
     """
     yf_end = (end + dt.timedelta(days=1)).isoformat() if end else None
-    data = yf.download(
-        tickers=" ".join(symbols),
+    download_kwargs = dict(
         start=start.isoformat(),
         end=yf_end,
         interval=interval,
@@ -35,13 +46,43 @@ def fetch_history(
         repair=repair,
         progress=progress,
         group_by=group_by,
-        threads=threads,
     )
+    if len(symbols) > YAHOO_MAX_SYMBOLS_PER_REQUEST:
+        data = _download_chunked(list(symbols), download_kwargs)
+    else:
+        data = yf.download(tickers=" ".join(symbols), threads=threads, **download_kwargs)
     if data is None or data.empty:
         raise DownloadError("No data returned (possibly invalid symbols, date span, or rate limit).")
     return data
 
 
+def _download_chunked(symbols: list[str], download_kwargs: dict) -> Optional[pd.DataFrame]:
+    """
+    Download symbols in groups of YAHOO_MAX_SYMBOLS_PER_REQUEST, one chunk per worker thread.
+    Each chunk runs with threads=False so yfinance does not spawn a second pool per chunk.
+    Without CONCURRENT_DOWNLOADS the chunks run one after another, since concurrent calls would
+    clobber each other's results in yfinance's shared state.
+    Chunks are concatenated column-wise, keeping the (ticker, field) layout.
+    """
+    step = YAHOO_MAX_SYMBOLS_PER_REQUEST
+    chunks = [symbols[i:i + step] for i in range(0, len(symbols), step)]
+
+    def _download(chunk: list[str]) -> Optional[pd.DataFrame]:
+        part = yf.download(tickers=" ".join(chunk), threads=False, **download_kwargs)
+        if part is None or part.empty:
+            return None
+        if download_kwargs.get("group_by") == "ticker" and not isinstance(part.columns, pd.MultiIndex):
+            # Single-ticker chunk may come back flat; restore the ticker level.
+            part = pd.concat({chunk[0]: part}, axis=1)
+        return part
+
+    workers = min(MAX_CHUNK_WORKERS, len(chunks)) if CONCURRENT_DOWNLOADS else 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = [r for r in executor.map(_download, chunks) if r is not None]
+    if not results:
+        return None
+    return pd.concat(results, axis=1)
+
 def select_columns(df: pd.DataFrame, columns: list[str] | None) -> pd.DataFrame:
     """
     Optionally select columns from (possibly multi-index) DataFrame.
@@ -49,8 +90,9 @@ def select_columns(df: pd.DataFrame, columns: list[str] | None) -> pd.DataFrame:
     if not columns:
         return df
     if isinstance(df.columns, pd.MultiIndex):
-        # Build list of (ticker, column) pairs preserving order
-        keep = [(lvl0, c) for lvl0 in df.columns.levels[0] for c in columns if (lvl0, c) in df.columns]
+        # Build (ticker, column) pairs preserving order; intersection runs as a hash join in pandas
+        desired = pd.MultiIndex.from_product([df.columns.levels[0], columns])
+        keep = desired.intersection(df.columns, sort=False)
         return df.loc[:, keep]
     else:
         # Single symbol case
@@ -1,9 +1,19 @@
 from __future__ import annotations
 import datetime as dt
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, Optional
 import pandas as pd
 
-from .twse_api import fetch_t86_single, fetch_bfi82u_single
+from .twse_api import (
+    fetch_t86_records,
+    fetch_bfi82u_single,
+    records_to_frame,
+    fetch_dates,
+    normalize_codes,
+    to_int_columns,
+    tighten_dtypes,
+    DEFAULT_TIMEOUT,
+    DEFAULT_MAX_WORKERS,
+)
 
 # Column mapping dictionaries (Chinese -> English)
 T86_COL_MAP = {
@@ -34,62 +44,73 @@ BFI82U_COL_MAP = {
     "買賣差額": "net_value",
 }
 
+T86_NUMERIC_COLS = [
+    "foreign_buy","foreign_sell","foreign_net",
+    "foreign_dealer_buy","foreign_dealer_sell","foreign_dealer_net",
+    "it_buy","it_sell","it_net",
+    "dealer_self_buy","dealer_self_sell","dealer_self_net",
+    "dealer_hedge_buy","dealer_hedge_sell","dealer_hedge_net",
+    "three_investors_net"
+]
+BFI82U_NUMERIC_COLS = ["buy_value", "sell_value", "net_value"]
+
+# Storage dtypes applied once parsing is done; codes and names repeat once per date.
+T86_SCHEMA = {"code": "category", "name": "category"}
+
+
+def _fetch_bfi82u_typed(date: dt.date, **kwargs) -> Optional[pd.DataFrame]:
+    """fetch_bfi82u_single plus renaming and numeric parsing, done per date."""
+    df = fetch_bfi82u_single(date, **kwargs)
+    if df is None:
+        return None
+    df = df.rename(columns={k: v for k, v in BFI82U_COL_MAP.items() if k in df.columns})
+    return to_int_columns(df, BFI82U_NUMERIC_COLS)
+
 
 def collect_t86(
     dates: Iterable[dt.date],
     retry: int = 0,
-    retry_wait: int = 3
+    retry_wait: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    use_cache: bool = True,
 ) -> pd.DataFrame:
-    """Loop over dates collecting T86 data; returns concatenated DataFrame (may be empty)."""
-    frames = []
-    missing = []
-    for d in dates:
-        df = fetch_t86_single(d, retry=retry, retry_wait=retry_wait)
-        if df is not None:
-            frames.append(df)
-        else:
-            missing.append(d)
+    """Fetch T86 data for all dates concurrently; returns concatenated DataFrame (may be empty)."""
+    results = fetch_dates(
+        fetch_t86_records, dates, max_workers=max_workers,
+        retry=retry, retry_wait=retry_wait, timeout=timeout, use_cache=use_cache,
+    )
+    missing = [d for d, records in results if records is None]
     if missing:
         print(f"[WARN] No T86 data for dates: {[x.isoformat() for x in missing]}")
-    if not frames:
+    # Raw rows from every date become one DataFrame, so the steps below run once over all of them
+    t86 = records_to_frame(results)
+    if t86.empty:
         return pd.DataFrame()
-    t86 = pd.concat(frames, ignore_index=True)
     t86 = t86.rename(columns={k: v for k, v in T86_COL_MAP.items() if k in t86.columns})
+    normalize_codes(t86)
     # Remove thousands separators and convert numeric columns
-    numeric_cols = [
-        "foreign_buy","foreign_sell","foreign_net",
-        "foreign_dealer_buy","foreign_dealer_sell","foreign_dealer_net",
-        "it_buy","it_sell","it_net",
-        "dealer_self_buy","dealer_self_sell","dealer_self_net",
-        "dealer_hedge_buy","dealer_hedge_sell","dealer_hedge_net",
-        "three_investors_net"
-    ]
-    for c in numeric_cols:
-        if c in t86.columns:
-            t86[c] = pd.to_numeric(
-                t86[c].astype(str).str.replace(",", "", regex=False),
-                errors="coerce"
-            ).astype("Int64")
-    return t86
+    to_int_columns(t86, T86_NUMERIC_COLS)
+    return tighten_dtypes(t86, T86_SCHEMA)
 
 
 def collect_bfi82u(
     dates: Iterable[dt.date],
     retry: int = 0,
-    retry_wait: int = 3
+    retry_wait: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    use_cache: bool = True,
 ) -> pd.DataFrame:
-    """Loop over dates collecting BFI82U market aggregate funds data."""
+    """Fetch BFI82U market aggregate funds data for all dates concurrently."""
     frames = []
-    for d in dates:
-        df = fetch_bfi82u_single(d, retry=retry, retry_wait=retry_wait)
+    results = fetch_dates(
+        _fetch_bfi82u_typed, dates, max_workers=max_workers,
+        retry=retry, retry_wait=retry_wait, timeout=timeout, use_cache=use_cache,
+    )
+    for _, df in results:
         if df is not None:
             frames.append(df)
     if not frames:
         return pd.DataFrame()
-    bfi = pd.concat(frames, ignore_index=True)
-    bfi = bfi.rename(columns={k: v for k, v in BFI82U_COL_MAP.items() if k in bfi.columns})
-    # Numeric conversion
-    for c in ["buy_value", "sell_value", "net_value"]:
-        if c in bfi.columns:
-            bfi[c] = bfi[c].astype(str).str.replace(",", "", regex=False).astype("Int64")
-    return bfi
+    return pd.concat(frames, ignore_index=True)
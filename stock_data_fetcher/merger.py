@@ -1,73 +1,95 @@
 from __future__ import annotations
 import pandas as pd
-from typing import Optional
+from typing import Dict, Optional
 
 def _strip_symbol_suffix(symbol: str) -> str:
     """Get the numeric code part only, e.g., '2330.TW' → '2330'."""
     return str(symbol).split('.')[0].strip()
 
+def _find_code_col(df: pd.DataFrame, names: tuple[str, ...] = ("code", "code_dt", "證券代號")) -> Optional[str]:
+    """Return the first column that looks like a stock code column, or None."""
+    candidates = [c for c in df.columns if c in names or "代號" in c]
+    return candidates[0] if candidates else None
+
+def build_code_index(df: Optional[pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    Split a TWSE frame into {code: rows} in one groupby pass.
+    Codes are expected to be normalized already (collect_t86 / collect_daytrade strip them).
+    Pass the result to merge_price_institution_daytrade so each symbol costs a dict lookup
+    instead of a boolean scan over the full frame.
+    """
+    if df is None or df.empty:
+        return {}
+    code_col = _find_code_col(df)
+    if code_col is None:
+        return {}
+    return {code: sub for code, sub in df.groupby(code_col, sort=False, observed=True)}
+
 def merge_price_institution_daytrade(
     price_df: pd.DataFrame,
     inst_df: Optional[pd.DataFrame],
     daytrade_df: Optional[pd.DataFrame],
     symbol: str,
-    date_col: str = "Date"
+    date_col: str = "Date",
+    inst_by_code: Optional[Dict[str, pd.DataFrame]] = None,
+    daytrade_by_code: Optional[Dict[str, pd.DataFrame]] = None,
 ) -> pd.DataFrame:
     """
     Merge price data with institutional (per-stock net flows) and day-trade stats.
     Handles symbol with or without .TW suffix.
+    inst_by_code / daytrade_by_code are optional build_code_index() results for the
+    corresponding frames; when given, rows are looked up instead of filtered.
     """
-    # Make a copy and ensure date_col is datetime.date
-    df = price_df.copy()
+    # Shallow copy: columns assigned below replace arrays on df only, and every merge
+    # returns a new frame, so the price data itself never needs duplicating.
+    df = price_df.copy(deep=False)
     if date_col in df.columns:
-        df[date_col] = pd.to_datetime(df[date_col]).dt.date
-    elif df.index.name and "date" in (df.index.name or "").lower():
-        df[date_col] = df.index.date
-    elif hasattr(df.index, "date"):
-        df[date_col] = df.index.date
+        dates = pd.DatetimeIndex(pd.to_datetime(df[date_col]))
+    elif isinstance(df.index, pd.DatetimeIndex):
+        dates = df.index
     else:
         raise ValueError("Cannot locate date column in price frame.")
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+    # Midnight timestamps line up with the datetime64 'date' column every fetch_*_single attaches
+    df[date_col] = dates.normalize()
 
     code_numeric = _strip_symbol_suffix(symbol)
 
     # -- Institutional data --
     if inst_df is not None and not inst_df.empty:
         # try to find a usable code column
-        possible_code_cols = [c for c in inst_df.columns if c in ("code", "證券代號") or "代號" in c]
-        code_col = possible_code_cols[0] if possible_code_cols else None
-        if code_col:
-            inst_codes = inst_df[code_col].astype(str).str.strip()
-            inst_sub = inst_df[inst_codes == code_numeric].copy()
+        code_col = _find_code_col(inst_df, ("code", "證券代號"))
+        if inst_by_code is not None:
+            inst_sub = inst_by_code.get(code_numeric, inst_df.iloc[0:0])
+        elif code_col:
+            inst_sub = inst_df[inst_df[code_col] == code_numeric]
         else:
-            inst_sub = inst_df.iloc[0:0].copy()
-        if "date" in inst_sub.columns:
-            inst_sub["date"] = pd.to_datetime(inst_sub["date"]).dt.date
+            inst_sub = inst_df.iloc[0:0]
         df = df.merge(
             inst_sub.drop(columns=["name"], errors="ignore"),
             left_on=date_col,
             right_on="date",
             how="left",
             suffixes=("", "_inst")
-        ).drop(columns=["date"], errors="ignore")
+        ).drop(columns=["date"])
 
     # -- Daytrade data --
     if daytrade_df is not None and not daytrade_df.empty:
-        possible_code_cols_dt = [c for c in daytrade_df.columns if c in ("code", "code_dt", "證券代號") or "代號" in c]
-        code_col_dt = possible_code_cols_dt[0] if possible_code_cols_dt else None
-        if code_col_dt:
-            dt_codes = daytrade_df[code_col_dt].astype(str).str.strip()
-            dt_sub = daytrade_df[dt_codes == code_numeric].copy()
+        code_col_dt = _find_code_col(daytrade_df)
+        if daytrade_by_code is not None:
+            dt_sub = daytrade_by_code.get(code_numeric, daytrade_df.iloc[0:0])
+        elif code_col_dt:
+            dt_sub = daytrade_df[daytrade_df[code_col_dt] == code_numeric]
         else:
-            dt_sub = daytrade_df.iloc[0:0].copy()
-        if "date" in dt_sub.columns:
-            dt_sub["date"] = pd.to_datetime(dt_sub["date"]).dt.date
+            dt_sub = daytrade_df.iloc[0:0]
         df = df.merge(
             dt_sub.drop(columns=["name"], errors="ignore"),
             left_on=date_col,
             right_on="date",
             how="left",
             suffixes=("", "_dt")
-        ).drop(columns=["date"], errors="ignore")
+        ).drop(columns=["date"])
 
     # Derive ratios if possible
     vol_col_candidates = [c for c in df.columns if c.lower() in ("volume", "vol")]
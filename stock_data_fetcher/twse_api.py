@@ -1,10 +1,34 @@
 from __future__ import annotations
+import copy
 import datetime as dt
+import functools
+import hashlib
+import io
+import json
 import logging
+import os
+import pathlib
+import threading
 import time
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+from typing import Optional, Dict, Any, List, Callable, Iterable, Tuple
 import requests
+import numpy as np
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+# "gzip,deflate" plus ",br"/",zstd" when a brotli/zstandard decoder is installed (see the 'brotli' extra)
+from urllib3.util.request import ACCEPT_ENCODING
+
+from . import __version__
+from .utils import format_yyyymmdd, is_tw_trading_day
+
+try:  # optional speedup (see the 'orjson' extra); TWSE payloads are large numeric-string tables
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -16,58 +40,425 @@ ENDPOINT_BFI82U = "/rwd/zh/fund/BFI82U"  # Market aggregate
 ENDPOINT_DAYTRADE = "/exchangeReport/TWTB4U"
 
 DEFAULT_TIMEOUT = 10
+DEFAULT_MAX_WORKERS = 4
+# TWSE is reported to block IPs sending more than about 3 requests per 5 seconds, so request
+# starts are spaced this many seconds apart across all threads. Cache hits do not count.
+MIN_REQUEST_INTERVAL = 2.0
 
+# Closed trading days never change, so parsed per-date frames are cached on disk between runs.
+CACHE_DIR = pathlib.Path("~/.cache/stock-data-fetcher").expanduser()
+
+# Successful JSON bodies kept in memory for the life of the process, keyed by URL and params.
+# A decoded T86 day is about 1.8 MB, so 8 entries pin roughly 15 MB. Only dates the on-disk
+# cache will not store get here, and the CLI requests each (endpoint, date) once per run, so
+# this only helps library callers that repeat a fetch.
+RESPONSE_MEMO_SIZE = 8
+
+
+class _BackoffRetry(Retry):
+    """urllib3 Retry that waits backoff_factor before the first retry instead of retrying at once."""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff == 0 and self.history and self.history[-1].redirect_location is None:
+            return float(self.backoff_factor)
+        return backoff
+
+
+def _build_retry(retry: int, retry_wait: float) -> Retry:
+    """
+    Exponential backoff (retry_wait, 2*retry_wait, 4*retry_wait, ...) with jitter on connection
+    errors and 429/5xx only; client errors fail fast. Retry-After from a rate-limited response wins.
+    """
+    kwargs = dict(
+        total=retry,
+        backoff_factor=retry_wait,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return _BackoffRetry(backoff_jitter=0.3, **kwargs)
+    except TypeError:  # urllib3 < 2 has no jitter support
+        return _BackoffRetry(**kwargs)
+
+
+def _build_session(retry: int = 0, retry_wait: float = 3) -> requests.Session:
+    """Session that reuses pooled keep-alive connections instead of a fresh TLS handshake per call."""
+    session = requests.Session()
+    # pool_maxsize must cover the fetch_dates thread pool or extra connections get discarded
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=_build_retry(retry, retry_wait))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": f"stock-data-fetcher/{__version__}",
+        "Accept": "application/json",
+        "Accept-Encoding": ACCEPT_ENCODING,
+    })
+    return session
+
+
+# One Session per (retry, retry_wait) policy, since urllib3 retries are configured on the adapter.
+_SESSIONS: Dict[Tuple[int, float], requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_session(retry: int = 0, retry_wait: float = 3) -> requests.Session:
+    key = (retry, retry_wait)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = _SESSIONS[key] = _build_session(retry, retry_wait)
+    return session
+
+
+def close_session() -> None:
+    """Close pooled TWSE connections (call once the CLI is done fetching)."""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+_NEXT_REQUEST_AT = 0.0
+_THROTTLE_LOCK = threading.Lock()
+
+
+def _throttle() -> None:
+    """Block until this thread may send the next TWSE request (shared MIN_REQUEST_INTERVAL spacing)."""
+    global _NEXT_REQUEST_AT
+    with _THROTTLE_LOCK:
+        now = time.monotonic()
+        start = max(now, _NEXT_REQUEST_AT)
+        _NEXT_REQUEST_AT = start + MIN_REQUEST_INTERVAL
+    if start > now:
+        time.sleep(start - now)
+
+
+def _http_cache_path(url: str, params: Dict[str, Any]) -> pathlib.Path:
+    """Location of the stored validators + body for one GET, keyed by URL and sorted params."""
+    key = f"{url}?{urlencode(sorted(params.items()))}"
+    return CACHE_DIR / "http" / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+
+def _load_http_cache(path: pathlib.Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _store_http_cache(path: pathlib.Path, response: requests.Response, js: Dict[str, Any]) -> None:
+    """Keep the body only when the server gave us a validator to revalidate it with later."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not (etag or last_modified):
+        return
+    entry = {"etag": etag, "last_modified": last_modified, "body": js}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.warning("Could not write HTTP cache file %s: %s", path, exc)
+
+
+class _NoJSON(Exception):
+    """Raised inside _get_json_memo so failed requests are not memoized."""
+
+
+@functools.lru_cache(maxsize=RESPONSE_MEMO_SIZE)
+def _get_json_memo(
+    url: str,
+    params: Tuple[Tuple[str, Any], ...],
+    retry: int,
+    retry_wait: int,
+    timeout: float,
+) -> Dict[str, Any]:
+    js = _request_json(url, dict(params), retry=retry, retry_wait=retry_wait, timeout=timeout, revalidate=True)
+    if js is None:
+        raise _NoJSON
+    return js
+
+
+def _get_json(
+    url: str,
+    params: Dict[str, Any],
+    retry: int = 0,
+    retry_wait: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+    http_cache: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    Generic GET returning JSON dict or None.
+    With http_cache, repeated requests for the same URL and params in one process reuse the
+    earlier body (each caller gets its own copy) and stored ETag/Last-Modified validators are
+    used; failures are not remembered, so they are retried. _get_json_memo.cache_clear() resets it.
+    """
+    if not http_cache:
+        return _request_json(url, params, retry=retry, retry_wait=retry_wait, timeout=timeout, revalidate=False)
+    try:
+        js = _get_json_memo(url, tuple(sorted(params.items())), retry, retry_wait, timeout)
+    except _NoJSON:
+        return None
+    return copy.deepcopy(js)
+
+
+def _request_json(
+    url: str,
+    params: Dict[str, Any],
+    retry: int = 0,
+    retry_wait: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+    revalidate: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    Issue the GET behind _get_json and return the JSON dict or None.
+    Transient failures are retried up to `retry` times by the Session adapter (see _build_retry).
+    With revalidate, sends If-None-Match / If-Modified-Since when an earlier response carried an
+    ETag or Last-Modified, and reuses the stored body on 304 Not Modified; without it the
+    CACHE_DIR/http store is neither read nor written.
+    """
+    cache_path = _http_cache_path(url, params)
+    cached = _load_http_cache(cache_path) if revalidate else None
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    try:
+        _throttle()
+        r = _get_session(retry, retry_wait).get(url, params=params, timeout=timeout, headers=headers)
+        if r.status_code == 304 and cached:
+            return cached["body"]
+        r.raise_for_status()
+        logger.debug("GET %s -> %s (Content-Encoding=%s)", url, r.status_code, r.headers.get("Content-Encoding"))
+        js = _json_loads(r.content)
+    except Exception as exc:
+        logger.warning("Request failed for %s params=%s: %s", url, params, exc)
+        return None
+    if js.get("stat") != "OK":
+        logger.warning("Non-OK status from %s params=%s stat=%s", url, params, js.get("stat"))
+        return None
+    if revalidate:
+        _store_http_cache(cache_path, r, js)
+    return js
+
+
+def _rows_to_df(rows: List[List[Any]], fields: List[str]) -> pd.DataFrame:
+    """
+    Build a DataFrame column-wise from TWSE's row lists: one transpose, then one object
+    array per field, instead of pandas laying out rows and splitting them into blocks.
+    """
+    if not rows:
+        return pd.DataFrame(columns=fields)
+    if len(set(fields)) != len(fields) or any(len(r) != len(fields) for r in rows):
+        # Duplicate or mismatched headers: let pandas apply its usual checks
+        return pd.DataFrame(rows, columns=fields or None)
+    cols = zip(*rows)
+    return pd.DataFrame({f: np.asarray(c, dtype=object) for f, c in zip(fields, cols)}, copy=False)
+
+
+def _read_csv_bytes(content: bytes) -> pd.DataFrame:
+    """
+    Parse a downloaded CSV body as raw strings, matching the JSON path: codes like '0050'
+    keep their leading zeros and numerics are converted later by to_int_columns.
+    """
+    return pd.read_csv(io.BytesIO(content), dtype=str)
+
+
+def normalize_codes(df: pd.DataFrame, column: str = "code") -> pd.DataFrame:
+    """
+    Strip stock codes to plain strings in place, once at ingest, so the merger can match
+    them without re-stripping per symbol. A missing column is left alone.
+    """
+    if column in df.columns:
+        df[column] = df[column].astype("string").str.strip()
+    return df
 
-def _get_json(url: str, params: Dict[str, Any], retry: int = 0, retry_wait: int = 3) -> Optional[Dict[str, Any]]:
-    """Generic GET returning JSON dict or None."""
-    for attempt in range(retry + 1):
-        try:
-            r = requests.get(url, params=params, timeout=DEFAULT_TIMEOUT)
-            r.raise_for_status()
-            js = r.json()
-            if js.get("stat") != "OK":
-                logger.warning("Non-OK status from %s params=%s stat=%s", url, params, js.get("stat"))
-                return None
-            return js
-        except Exception as exc:
-            logger.warning("Request failed (%s/%s): %s", attempt + 1, retry + 1, exc)
-            if attempt < retry:
-                time.sleep(retry_wait)
-    return None
+
+def to_int_columns(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """
+    Convert TWSE thousands-separated number strings (e.g. '1,234') to nullable Int64 in place.
+    All target columns are cleaned and parsed in a single vectorized pass; unparsable cells become <NA>.
+    """
+    cols = [c for c in columns if c in df.columns]
+    if not cols or df.empty:
+        return df
+    flat = pd.Series(df[cols].to_numpy().ravel()).astype(str).str.replace(",", "", regex=False)
+    values = pd.to_numeric(flat, errors="coerce").to_numpy().reshape(len(df), len(cols))
+    df[cols] = pd.DataFrame(values, columns=cols, index=df.index).astype("Int64")
+    return df
+
+
+def tighten_dtypes(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """
+    Shrink parsed TWSE columns in place according to a {column: kind} schema.
+    The only kind is "category" (repeated strings such as codes). Numeric columns are left as
+    Int64 on purpose: a width picked from the fetched values would let later arithmetic wrap.
+    Missing columns are skipped.
+    """
+    for col, kind in schema.items():
+        if col not in df.columns:
+            continue
+        if kind == "category":
+            df[col] = df[col].astype("category")
+        else:
+            raise ValueError(f"Unknown dtype kind {kind!r} for column {col!r}")
+    return df
 
 
-def fetch_t86_single(date: dt.date, retry: int = 0, retry_wait: int = 3) -> Optional[pd.DataFrame]:
+def _disk_cached(name: str) -> Callable:
+    """
+    Cache a fetch_*(date, ...) result under CACHE_DIR/<name>/<YYYY-MM-DD>.pkl.
+    Adds a use_cache keyword (default True). Only dates before today are cached, and
+    empty results are never stored so a date with no data yet is retried next run.
+    fetch gets http_cache=True only when use_cache is on and this cache will not store the
+    result, so the response memo and ETag store never duplicate a pickle or outlive --no-cache.
+    """
+    def decorator(fetch: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fetch)
+        def wrapper(date: dt.date, *args: Any, use_cache: bool = True, **kwargs: Any) -> Any:
+            path = CACHE_DIR / name / f"{date.isoformat()}.pkl"
+            cacheable = use_cache and date < dt.date.today()
+            if cacheable and path.exists():
+                try:
+                    return pd.read_pickle(path)
+                except Exception as exc:
+                    logger.warning("Ignoring unreadable cache file %s: %s", path, exc)
+            result = fetch(date, *args, http_cache=use_cache and not cacheable, **kwargs)
+            if cacheable and result is not None:
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+                    pd.to_pickle(result, tmp)
+                    os.replace(tmp, path)
+                except OSError as exc:
+                    logger.warning("Could not write cache file %s: %s", path, exc)
+            return result
+        return wrapper
+    return decorator
+
+
+T86Records = Tuple[List[List[Any]], List[str]]
+
+
+@_disk_cached("t86_records")
+def fetch_t86_records(
+    date: dt.date,
+    retry: int = 0,
+    retry_wait: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+    http_cache: bool = True,
+) -> Optional[T86Records]:
+    """
+    Fetch T86 (institutional investors by stock) for a single date as raw (rows, fields).
+    Returns None if unavailable.
+    """
+    if not is_tw_trading_day(date):
+        return None
+    params = {"date": format_yyyymmdd(date), "selectType": "ALL", "response": "json"}
+    js = _get_json(
+        TWSE_BASE + ENDPOINT_T86, params,
+        retry=retry, retry_wait=retry_wait, timeout=timeout, http_cache=http_cache,
+    )
+    if not js or not js.get("data"):
+        return None
+    return js["data"], js.get("fields", [])
+
+
+def fetch_t86_single(
+    date: dt.date,
+    retry: int = 0,
+    retry_wait: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+    use_cache: bool = True,
+) -> Optional[pd.DataFrame]:
     """
     Fetch T86 (institutional investors by stock) for a single date.
     Returns a DataFrame or None if unavailable.
     """
-    params = {"date": date.strftime("%Y%m%d"), "selectType": "ALL", "response": "json"}
-    js = _get_json(TWSE_BASE + ENDPOINT_T86, params, retry=retry, retry_wait=retry_wait)
-    if not js:
-        return None
-    df = pd.DataFrame(js.get("data", []), columns=js.get("fields", []))
-    if df.empty:
+    records = fetch_t86_records(date, retry=retry, retry_wait=retry_wait, timeout=timeout, use_cache=use_cache)
+    if records is None:
         return None
-    df["date"] = date
+    rows, fields = records
+    df = _rows_to_df(rows, fields)
+    df["date"] = pd.Timestamp(date)
     return df
 
 
-def fetch_bfi82u_single(date: dt.date, retry: int = 0, retry_wait: int = 3) -> Optional[pd.DataFrame]:
+def records_to_frame(results: Iterable[Tuple[dt.date, Optional[T86Records]]]) -> pd.DataFrame:
+    """
+    Build one DataFrame from many dates' raw (rows, fields), with a 'date' column expanded
+    via np.repeat, instead of one DataFrame per date followed by a concat.
+    Dates are grouped by field list so a TWSE schema change inside the range still lines up.
+    """
+    by_fields: Dict[Tuple[str, ...], Tuple[List[List[Any]], List[dt.date], List[int]]] = {}
+    for d, records in results:
+        if records is None:
+            continue
+        rows, fields = records
+        all_rows, row_dates, counts = by_fields.setdefault(tuple(fields), ([], [], []))
+        all_rows.extend(rows)
+        row_dates.append(d)
+        counts.append(len(rows))
+    frames = []
+    for fields, (all_rows, row_dates, counts) in by_fields.items():
+        df = _rows_to_df(all_rows, list(fields))
+        df["date"] = np.repeat(pd.to_datetime(row_dates).to_numpy(), counts)
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame()
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+def fetch_t86_range(
+    dates: Iterable[dt.date],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Fetch T86 for every date concurrently and return a single raw DataFrame (may be empty)."""
+    return records_to_frame(fetch_dates(fetch_t86_records, dates, max_workers=max_workers, **kwargs))
+
+
+@_disk_cached("bfi82u")
+def fetch_bfi82u_single(
+    date: dt.date,
+    retry: int = 0,
+    retry_wait: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+    http_cache: bool = True,
+) -> Optional[pd.DataFrame]:
     """
     Fetch market aggregate institutional funds (BFI82U).
     """
-    params = {"dayDate": date.strftime("%Y%m%d"), "type": "ALL", "response": "json"}
-    js = _get_json(TWSE_BASE + ENDPOINT_BFI82U, params, retry=retry, retry_wait=retry_wait)
+    if not is_tw_trading_day(date):
+        return None
+    params = {"dayDate": format_yyyymmdd(date), "type": "ALL", "response": "json"}
+    js = _get_json(
+        TWSE_BASE + ENDPOINT_BFI82U, params,
+        retry=retry, retry_wait=retry_wait, timeout=timeout, http_cache=http_cache,
+    )
     if not js:
         return None
-    df = pd.DataFrame(js.get("data", []), columns=js.get("fields", []))
+    df = _rows_to_df(js.get("data", []), js.get("fields", []))
     if df.empty:
         return None
-    df["date"] = date
+    df["date"] = pd.Timestamp(date)
     return df
 
 
-def fetch_daytrade_single(date: dt.date, retry: int = 0, retry_wait: int = 3) -> Optional[pd.DataFrame]:
+@_disk_cached("daytrade")
+def fetch_daytrade_single(
+    date: dt.date,
+    retry: int = 0,
+    retry_wait: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+    http_cache: bool = True,
+) -> Optional[pd.DataFrame]:
     """
     Fetch day trading statistics (TWTB4U) for a single date.
 
@@ -76,24 +467,31 @@ def fetch_daytrade_single(date: dt.date, retry: int = 0, retry_wait: int = 3) ->
       2) If JSON not OK (stat != OK) or 404, fallback to CSV open_data endpoint.
       3) Return None on weekends/holidays (TWSE returns no data; we quietly skip).
     """
-    # Skip weekends quickly to avoid useless requests
-    if date.weekday() >= 5:
+    # Skip weekends and known holidays quickly to avoid useless requests
+    if not is_tw_trading_day(date):
         return None
 
-    params_json = {"date": date.strftime("%Y%m%d"), "response": "json"}
-    js = _get_json(TWSE_BASE + ENDPOINT_DAYTRADE, params_json, retry=retry, retry_wait=retry_wait)
+    params_json = {"date": format_yyyymmdd(date), "response": "json"}
+    js = _get_json(
+        TWSE_BASE + ENDPOINT_DAYTRADE, params_json,
+        retry=retry, retry_wait=retry_wait, timeout=timeout, http_cache=http_cache,
+    )
 
     df: Optional[pd.DataFrame] = None
     if js:
-        tmp = pd.DataFrame(js.get("data", []), columns=js.get("fields", []))
+        tmp = _rows_to_df(js.get("data", []), js.get("fields", []))
         if not tmp.empty:
             df = tmp
 
     # Fallback to CSV if JSON failed or returned empty
     if df is None or df.empty:
-        csv_url = f"{TWSE_BASE}{ENDPOINT_DAYTRADE}?response=open_data&date={date.strftime('%Y%m%d')}"
+        params_csv = {"response": "open_data", "date": format_yyyymmdd(date)}
         try:
-            tmp = pd.read_csv(csv_url)
+            # Same pooled Session as the JSON call, instead of read_csv opening its own connection
+            _throttle()
+            resp = _get_session(retry, retry_wait).get(TWSE_BASE + ENDPOINT_DAYTRADE, params=params_csv, timeout=timeout)
+            resp.raise_for_status()
+            tmp = _read_csv_bytes(resp.content)
             if not tmp.empty:
                 df = tmp
         except Exception as exc:
@@ -103,5 +501,31 @@ def fetch_daytrade_single(date: dt.date, retry: int = 0, retry_wait: int = 3) ->
     if df is None or df.empty:
         return None
 
-    df["date"] = date
+    df["date"] = pd.Timestamp(date)
     return df
+
+
+def fetch_dates(
+    fetch_single: Callable[..., Any],
+    dates: Iterable[dt.date],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    **kwargs: Any,
+) -> List[Tuple[dt.date, Any]]:
+    """
+    Run ``fetch_single(date, **kwargs)`` for every date on a thread pool.
+    Returns (date, result or None) pairs in the original date order; a date whose
+    request raised is reported as None so one bad day does not abort the batch.
+    """
+    dates = list(dates)
+    if not dates:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(dates)))) as executor:
+        futures = [executor.submit(fetch_single, d, **kwargs) for d in dates]
+        results: List[Tuple[dt.date, Any]] = []
+        for d, fut in zip(dates, futures):
+            try:
+                results.append((d, fut.result()))
+            except requests.RequestException as exc:
+                logger.warning("Fetch failed for %s: %s", d, exc)
+                results.append((d, None))
+    return results
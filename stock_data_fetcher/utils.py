@@ -1,9 +1,18 @@
 from __future__ import annotations
 import re
 import datetime as dt
+import functools
 from typing import Iterable, List
 
-_NUMERIC_TW = re.compile(r"^\d{3,6}$")  # typical numeric ticker length for TW markets
+_NUMERIC_TW = re.compile(r"\d{3,6}")  # used with fullmatch; typical numeric ticker length for TW markets
+
+# Fixed-date national holidays TWSE always closes for: New Year's Day, Peace Memorial Day, National Day.
+# Lunar holidays, make-up closures and typhoon days vary by year; install exchange_calendars to cover them.
+TWSE_HOLIDAYS: frozenset[dt.date] = frozenset(
+    dt.date(year, month, day)
+    for year in range(1998, 2041)
+    for month, day in ((1, 1), (2, 28), (10, 10))
+)
 
 
 def normalize_symbols(raw: Iterable[str], auto_tw: bool = True) -> List[str]:
@@ -13,25 +22,61 @@ def normalize_symbols(raw: Iterable[str], auto_tw: bool = True) -> List[str]:
     - If numeric and auto_tw enabled, append '.TW'
     - Preserve order and uniqueness
     """
-    seen = set()
-    result: List[str] = []
-    for s in raw:
-        s2 = s.strip()
-        if not s2:
-            continue
-        if auto_tw and _NUMERIC_TW.match(s2):
-            s2 = s2 + ".TW"
-        if s2 not in seen:
-            seen.add(s2)
-            result.append(s2)
-    return result
+    # dict.fromkeys de-duplicates while keeping first-seen order; the one-item inner loop binds
+    # the stripped symbol so strip() runs once per entry
+    return list(dict.fromkeys(
+        s2 + ".TW" if auto_tw and _NUMERIC_TW.fullmatch(s2) else s2
+        for s in raw
+        for s2 in (s.strip(),)
+        if s2
+    ))
 
 
 def parse_date(date_str: str) -> dt.date:
-    """Parse YYYY-MM-DD into date."""
-    return dt.datetime.strptime(date_str, "%Y-%m-%d").date()
+    """Parse YYYY-MM-DD into date (plain split + int, avoiding strptime's format parsing)."""
+    try:
+        y, m, d = date_str.split("-")
+        # int() alone would accept short years and surrounding whitespace, which strptime rejects
+        digits = y + m + d
+        if not (len(y) == 4 and 1 <= len(m) <= 2 and 1 <= len(d) <= 2 and digits.isascii() and digits.isdigit()):
+            raise ValueError
+        return dt.date(int(y), int(m), int(d))
+    except ValueError:
+        raise ValueError(f"time data {date_str!r} does not match format 'YYYY-MM-DD'") from None
+
+
+def format_yyyymmdd(d: dt.date) -> str:
+    """Return YYYYMMDD (f-string over the date fields, no strftime)."""
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
 
 
 def format_date_for_filename(d: dt.date | None) -> str:
     """Return YYYYMMDD or 'latest' if None."""
-    return d.strftime("%Y%m%d") if d else "latest"
+    return format_yyyymmdd(d) if d else "latest"
+
+
+@functools.lru_cache(maxsize=1)
+def _xtai_calendar():
+    """Taiwan Stock Exchange calendar from the optional exchange_calendars package, or None."""
+    try:
+        import exchange_calendars
+    except ImportError:
+        return None
+    return exchange_calendars.get_calendar("XTAI")
+
+
+def is_tw_trading_day(d: dt.date) -> bool:
+    """
+    Return False for dates TWSE is known to be closed: weekends, TWSE_HOLIDAYS and,
+    when exchange_calendars is installed, every non-session day of its XTAI calendar.
+    """
+    if d.weekday() >= 5 or d in TWSE_HOLIDAYS:
+        return False
+    calendar = _xtai_calendar()
+    if calendar is None:
+        return True
+    try:
+        return bool(calendar.is_session(d.isoformat()))
+    except Exception:
+        # Outside the calendar's bounds; don't block the request on it
+        return True
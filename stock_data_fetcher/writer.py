@@ -1,24 +1,53 @@
 from __future__ import annotations
 import pathlib
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from typing import Iterable
 from .exceptions import OutputError
 from .utils import format_date_for_filename
 
+# 1 MiB write buffer: rows of numeric CSV are small, so this amortizes many write() syscalls.
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Per-symbol files are written concurrently; file writes release the GIL
+MAX_WRITE_WORKERS = 8
+
 
 def ensure_dir(path: pathlib.Path) -> None:
     """Create directory if it does not exist."""
     path.mkdir(parents=True, exist_ok=True)
 
 
+def write_csv(df: pd.DataFrame, path: pathlib.Path, index: bool = True) -> None:
+    """Write df as CSV through an explicitly buffered binary file handle."""
+    with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as fh:
+        df.to_csv(fh, index=index)
+
+
+def write_parquet(df: pd.DataFrame, path: pathlib.Path, index: bool = True) -> None:
+    """Write df as zstd-compressed Parquet via pyarrow (optional dependency)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise OutputError("Parquet output requires pyarrow (pip install 'stock-data-fetcher[parquet]').") from e
+    table = pa.Table.from_pandas(df, preserve_index=index)
+    pq.write_table(table, path, compression="zstd")
+
+
 def generate_filename(symbol: str, start: dt.date, end: dt.date | None, ext: str = "csv") -> str:
     """
     Filename pattern: <SYMBOL>_<START>_<END>.<ext>
     - START, END formatted as YYYYMMDD
     - END 'latest' if None
     """
-    return f"{symbol}_{format_date_for_filename(start)}_{format_date_for_filename(end)}.{ext}"
+    return _filename(symbol, format_date_for_filename(start), format_date_for_filename(end), ext)
+
+
+def _filename(symbol: str, start_tag: str, end_tag: str, ext: str) -> str:
+    """generate_filename with the YYYYMMDD/'latest' tags already formatted."""
+    return f"{symbol}_{start_tag}_{end_tag}.{ext}"
 
 
 def write_symbol_frames(
@@ -35,24 +64,47 @@ def write_symbol_frames(
     Returns list of written file paths.
     """
     ensure_dir(output_dir)
-    written = []
+    prepared: list[tuple[pd.DataFrame, pathlib.Path]] = []
+
+    # Column positions per ticker, found in one pass over the first level instead of an
+    # index walk per symbol
+    ticker_positions = None
+    if isinstance(df.columns, pd.MultiIndex):
+        ticker_positions = pd.RangeIndex(df.shape[1]).groupby(df.columns.get_level_values(0))
+
+    # Date tags are the same for every symbol, so format them once
+    start_tag = format_date_for_filename(start)
+    end_tag = format_date_for_filename(end)
 
+    # Slicing is cheap and stays serial; only the writes go to the thread pool
     for sym in symbols:
-        if isinstance(df.columns, pd.MultiIndex):
-            if sym not in df.columns.levels[0]:
+        if ticker_positions is not None:
+            positions = ticker_positions.get(sym)
+            if positions is None:
                 continue
-            sub = df[sym]
+            sub = df.iloc[:, positions]
+            sub.columns = sub.columns.droplevel(0)
         else:
             # Single ticker scenario: entire frame
             sub = df
-        filename = generate_filename(sym, start, end, ext=file_format)
-        filepath = output_dir / filename
+        prepared.append((sub, output_dir / _filename(sym, start_tag, end_tag, file_format)))
+
+    if not prepared:
+        return []
+
+    def _write_one(job: tuple[pd.DataFrame, pathlib.Path]) -> pathlib.Path:
+        sub, filepath = job
         try:
             if file_format == "csv":
-                sub.to_csv(filepath, index=include_index)
+                write_csv(sub, filepath, index=include_index)
+            elif file_format == "parquet":
+                write_parquet(sub, filepath, index=include_index)
             else:
                 raise OutputError(f"Unsupported file format requested: {file_format}")
         except Exception as e:
             raise OutputError(f"Failed to write {filepath}: {e}") from e
-        written.append(filepath)
-    return written
+        return filepath
+
+    # map re-raises the first worker's OutputError here and keeps paths in symbol order
+    with ThreadPoolExecutor(max_workers=min(MAX_WRITE_WORKERS, len(prepared))) as executor:
+        return list(executor.map(_write_one, prepared))
@@ -7,3 +7,7 @@ def test_cli_help_parse():
         "--end-date","2025-01-05"
     ])
     assert args.start_date == "2025-01-01"
+
+def test_merge_only_requires_twse_source():
+    from stock_data_fetcher.cli import main
+    assert main(["--symbols", "2330", "--start-date", "2025-01-01", "--merge-only"]) == 2
@@ -0,0 +1,15 @@
+import datetime as dt
+import pytest
+from stock_data_fetcher.utils import parse_date, format_date_for_filename, format_yyyymmdd
+
+def test_parse_date_roundtrip():
+    d = parse_date("2025-07-18")
+    assert d == dt.date(2025, 7, 18)
+    assert format_date_for_filename(d) == "20250718"
+    assert format_date_for_filename(None) == "latest"
+    assert format_yyyymmdd(dt.date(987, 1, 2)) == "09870102"
+
+def test_parse_date_rejects_other_formats():
+    for bad in ["2025/07/18", "25-01-01", " 2025-01-01", "2025-01-01 ", "2025-+1-01", "2025-001-01", ""]:
+        with pytest.raises(ValueError):
+            parse_date(bad)
@@ -0,0 +1,41 @@
+import datetime as dt
+import time
+import pandas as pd
+import stock_data_fetcher.fetcher as fetcher
+
+def test_fetch_history_chunks_large_symbol_lists(monkeypatch):
+    calls = []
+
+    def fake_download(tickers, threads, **kwargs):
+        syms = tickers.split()
+        calls.append((syms, threads))
+        idx = pd.to_datetime(["2025-01-02"])
+        cols = pd.MultiIndex.from_product([syms, ["Close"]])
+        return pd.DataFrame([[1.0] * len(syms)], index=idx, columns=cols)
+
+    monkeypatch.setattr(fetcher.yf, "download", fake_download)
+    symbols = [f"S{i}" for i in range(45)]
+    data = fetcher.fetch_history(symbols, dt.date(2025, 1, 1), dt.date(2025, 1, 3))
+    assert sorted(len(c[0]) for c in calls) == [5, 20, 20]
+    assert all(threads is False for _, threads in calls)
+    assert list(data.columns.get_level_values(0)) == symbols
+
+
+def test_fetch_history_runs_chunks_serially_without_per_call_state(monkeypatch):
+    active, peak = [0], [0]
+
+    def fake_download(tickers, threads, **kwargs):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        active[0] -= 1
+        syms = tickers.split()
+        cols = pd.MultiIndex.from_product([syms, ["Close"]])
+        return pd.DataFrame([[1.0] * len(syms)], index=pd.to_datetime(["2025-01-02"]), columns=cols)
+
+    monkeypatch.setattr(fetcher.yf, "download", fake_download)
+    monkeypatch.setattr(fetcher, "CONCURRENT_DOWNLOADS", False)
+    symbols = [f"S{i}" for i in range(65)]
+    data = fetcher.fetch_history(symbols, dt.date(2025, 1, 1), dt.date(2025, 1, 3))
+    assert peak[0] == 1
+    assert list(data.columns.get_level_values(0)) == symbols
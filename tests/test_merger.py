@@ -0,0 +1,43 @@
+import datetime as dt
+import pandas as pd
+from stock_data_fetcher.merger import build_code_index, merge_price_institution_daytrade
+
+def _price():
+    return pd.DataFrame({"Date": pd.to_datetime(["2025-01-02", "2025-01-03"]), "Volume": [1000, 2000]})
+
+def _t86():
+    return pd.DataFrame({
+        "code": ["2330", "2317", "2330"],
+        "name": ["TSMC", "HH", "TSMC"],
+        "foreign_net": [100, 5, 200],
+        "date": pd.to_datetime([dt.date(2025, 1, 2), dt.date(2025, 1, 2), dt.date(2025, 1, 3)]),
+    })
+
+def test_build_code_index_groups_rows():
+    index = build_code_index(_t86())
+    assert sorted(index) == ["2317", "2330"]
+    assert index["2330"]["foreign_net"].tolist() == [100, 200]
+
+def test_merge_with_code_index_matches_scan():
+    t86 = _t86()
+    index = build_code_index(t86)
+    for symbol in ("2330.TW", "9999.TW"):
+        scanned = merge_price_institution_daytrade(_price(), t86, None, symbol)
+        indexed = merge_price_institution_daytrade(_price(), t86, None, symbol, inst_by_code=index)
+        pd.testing.assert_frame_equal(scanned, indexed)
+    merged = merge_price_institution_daytrade(_price(), t86, None, "2330.TW", inst_by_code=index)
+    assert merged["foreign_net_ratio"].tolist() == [0.1, 0.1]
+
+def test_categorical_codes_are_matched():
+    t86 = _t86()
+    t86["code"] = t86["code"].astype("category")
+    merged = merge_price_institution_daytrade(_price(), t86, None, "2330.TW")
+    assert merged["foreign_net"].tolist() == [100, 200]
+    assert sorted(build_code_index(t86)) == ["2317", "2330"]
+
+def test_merge_leaves_inputs_untouched():
+    price, t86 = _price(), _t86()
+    price_before, t86_before = price.copy(), t86.copy()
+    merge_price_institution_daytrade(price, t86, None, "2330.TW", inst_by_code=build_code_index(t86))
+    pd.testing.assert_frame_equal(price, price_before)
+    pd.testing.assert_frame_equal(t86, t86_before)
@@ -0,0 +1,8 @@
+import pandas as pd
+from stock_data_fetcher.fetcher import select_columns
+
+def test_select_columns_multiindex_order_and_missing():
+    cols = pd.MultiIndex.from_product([["MSFT", "AAPL"], ["Open", "Close", "Volume"]])
+    df = pd.DataFrame([range(6)], columns=cols).drop(columns=[("AAPL", "Volume")])
+    out = select_columns(df, ["Volume", "Close", "Nope"])
+    assert list(out.columns) == [("AAPL", "Close"), ("MSFT", "Volume"), ("MSFT", "Close")]
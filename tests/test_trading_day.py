@@ -0,0 +1,8 @@
+import datetime as dt
+from stock_data_fetcher.utils import is_tw_trading_day
+
+def test_weekends_and_fixed_holidays_are_skipped():
+    assert not is_tw_trading_day(dt.date(2025, 1, 4))   # Saturday
+    assert not is_tw_trading_day(dt.date(2025, 1, 1))   # New Year's Day
+    assert not is_tw_trading_day(dt.date(2024, 10, 10))  # National Day
+    assert is_tw_trading_day(dt.date(2025, 1, 2))
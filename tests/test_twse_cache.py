@@ -0,0 +1,123 @@
+import datetime as dt
+import json
+import stock_data_fetcher.twse_api as api
+
+def test_fetch_t86_single_reuses_disk_cache(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_get_json(url, params, **kwargs):
+        calls.append(params["date"])
+        return {"stat": "OK", "fields": ["證券代號"], "data": [["2330"]]}
+
+    monkeypatch.setattr(api, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(api, "_get_json", fake_get_json)
+    day = dt.date(2025, 1, 2)
+    first = api.fetch_t86_single(day)
+    second = api.fetch_t86_single(day)
+    assert calls == ["20250102"]
+    assert second.equals(first)
+    assert (tmp_path / "t86_records" / "2025-01-02.pkl").exists()
+    api.fetch_t86_single(day, use_cache=False)
+    assert len(calls) == 2
+
+class _FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+
+    @property
+    def content(self):
+        return json.dumps(self._body).encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, params=None, timeout=None, headers=None):
+        self.sent_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def test_get_json_revalidates_with_etag(monkeypatch, tmp_path):
+    body = {"stat": "OK", "fields": ["a"], "data": [["1"]]}
+    session = _FakeSession([
+        _FakeResponse(200, body, {"ETag": '"v1"'}),
+        _FakeResponse(304),
+    ])
+    monkeypatch.setattr(api, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(api, "MIN_REQUEST_INTERVAL", 0)
+    monkeypatch.setattr(api, "_get_session", lambda *args: session)
+    params = {"date": "20250102", "response": "json"}
+    assert api._request_json("https://example.test/T86", params) == body
+    assert api._request_json("https://example.test/T86", params) == body
+    assert session.sent_headers == [{}, {"If-None-Match": '"v1"'}]
+
+
+def test_get_json_memoizes_successes_only(monkeypatch):
+    calls = []
+    replies = [None, {"stat": "OK", "data": []}]
+
+    def fake_request_json(url, params, **kwargs):
+        calls.append(params)
+        return replies.pop(0)
+
+    monkeypatch.setattr(api, "_request_json", fake_request_json)
+    api._get_json_memo.cache_clear()
+    params = {"date": "20250102", "response": "json"}
+    assert api._get_json("https://example.test/T86", params) is None
+    assert api._get_json("https://example.test/T86", params) == {"stat": "OK", "data": []}
+    assert api._get_json("https://example.test/T86", dict(reversed(params.items()))) == {"stat": "OK", "data": []}
+    assert calls == [params, params]
+    api._get_json_memo.cache_clear()
+
+
+def test_use_cache_false_skips_response_memo(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_request_json(url, params, **kwargs):
+        calls.append(params["date"])
+        return {"stat": "OK", "fields": ["證券代號"], "data": [["2330"]]}
+
+    monkeypatch.setattr(api, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(api, "_request_json", fake_request_json)
+    api._get_json_memo.cache_clear()
+    day = dt.date(2025, 1, 2)
+    api.fetch_t86_records(day, use_cache=False)
+    api.fetch_t86_records(day, use_cache=False)
+    assert calls == ["20250102", "20250102"]
+
+
+def test_get_json_hands_out_copies(monkeypatch):
+    monkeypatch.setattr(api, "_request_json", lambda url, params, **kwargs: {"stat": "OK", "data": [["1"]]})
+    api._get_json_memo.cache_clear()
+    first = api._get_json("https://example.test/T86", {"date": "20250102"})
+    first["data"].append(["2"])
+    first["data"][0].append("x")
+    assert api._get_json("https://example.test/T86", {"date": "20250102"})["data"] == [["1"]]
+    api._get_json_memo.cache_clear()
+
+
+def test_etag_store_only_for_dates_the_disk_cache_skips(monkeypatch, tmp_path):
+    seen = []
+
+    def fake_request_json(url, params, revalidate=True, **kwargs):
+        seen.append((params["date"], revalidate))
+        return {"stat": "OK", "fields": ["證券代號"], "data": [["2330"]]}
+
+    monkeypatch.setattr(api, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(api, "_request_json", fake_request_json)
+    monkeypatch.setattr(api, "is_tw_trading_day", lambda d: True)
+    api._get_json_memo.cache_clear()
+    past, today = dt.date(2025, 1, 2), dt.date.today()
+    api.fetch_t86_records(past)
+    api.fetch_t86_records(past, use_cache=False)
+    api.fetch_t86_records(today, use_cache=False)
+    api.fetch_t86_records(today)
+    assert [r for _, r in seen] == [False, False, False, True]
+    api._get_json_memo.cache_clear()
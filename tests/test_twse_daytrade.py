@@ -0,0 +1,35 @@
+import datetime as dt
+import pathlib
+import stock_data_fetcher.twse_api as api
+
+def test_fetch_daytrade_single_is_defined_once():
+    package = pathlib.Path(api.__file__).parent
+    defs = [p.name for p in package.rglob("*.py") if "def fetch_daytrade_single(" in p.read_text(encoding="utf-8")]
+    assert defs == ["twse_api.py"]
+
+
+def test_daytrade_csv_fallback_uses_json_endpoint(monkeypatch, tmp_path):
+    json_urls, csv_urls = [], []
+
+    class _CsvResponse:
+        content = "證券代號,當日沖銷交易成交股數\n2330,300\n".encode("utf-8")
+
+        def raise_for_status(self):
+            pass
+
+    class _Session:
+        def get(self, url, params=None, timeout=None):
+            csv_urls.append(url)
+            return _CsvResponse()
+
+    def fake_get_json(url, params, **kwargs):
+        json_urls.append(url)
+        return None
+
+    monkeypatch.setattr(api, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(api, "MIN_REQUEST_INTERVAL", 0)
+    monkeypatch.setattr(api, "_get_json", fake_get_json)
+    monkeypatch.setattr(api, "_get_session", lambda *args: _Session())
+    df = api.fetch_daytrade_single(dt.date(2025, 1, 2), use_cache=False)
+    assert df["證券代號"].tolist() == ["2330"]
+    assert json_urls == csv_urls == [api.TWSE_BASE + api.ENDPOINT_DAYTRADE]
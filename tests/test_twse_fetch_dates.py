@@ -0,0 +1,30 @@
+import datetime as dt
+import pandas as pd
+import requests
+from stock_data_fetcher.twse_api import fetch_dates
+
+def test_fetch_dates_preserves_order_and_isolates_errors():
+    dates = [dt.date(2025, 1, d) for d in range(1, 6)]
+
+    def fake_fetch(d, tag=None):
+        if d.day == 3:
+            raise requests.HTTPError("boom")
+        return pd.DataFrame({"date": [d], "tag": [tag]})
+
+    results = fetch_dates(fake_fetch, dates, max_workers=4, tag="x")
+    assert [d for d, _ in results] == dates
+    assert results[2][1] is None
+    assert all(df is not None and df["tag"].iloc[0] == "x" for d, df in results if d.day != 3)
+
+
+def test_throttle_spaces_requests_across_calls(monkeypatch):
+    import stock_data_fetcher.twse_api as api
+    sleeps = []
+    monkeypatch.setattr(api, "MIN_REQUEST_INTERVAL", 2.0)
+    monkeypatch.setattr(api, "_NEXT_REQUEST_AT", 0.0)
+    monkeypatch.setattr(api.time, "sleep", sleeps.append)
+    for _ in range(3):
+        api._throttle()
+    assert len(sleeps) == 2
+    assert 1.9 < sleeps[0] <= 2.0
+    assert 3.9 < sleeps[1] <= 4.0
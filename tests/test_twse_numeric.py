@@ -0,0 +1,38 @@
+import datetime as dt
+import pandas as pd
+from stock_data_fetcher import institutional_fetcher
+from stock_data_fetcher.twse_api import to_int_columns, tighten_dtypes, normalize_codes
+
+def test_to_int_columns_strips_thousands_separators():
+    df = pd.DataFrame({"buy": ["1,234", "--"], "net": ["-5,000", "7"], "name": ["A", "B"]})
+    to_int_columns(df, ["buy", "net", "missing"])
+    assert df["buy"].tolist() == [1234, pd.NA]
+    assert df["net"].tolist() == [-5000, 7]
+    assert str(df["buy"].dtype) == "Int64"
+    assert df["name"].tolist() == ["A", "B"]
+
+
+def test_tighten_dtypes_only_categorizes():
+    df = pd.DataFrame({"code": ["2330", "2317", "2330"], "net": pd.array([1, None, -3], dtype="Int64")})
+    tighten_dtypes(df, {"code": "category", "missing": "category"})
+    assert isinstance(df["code"].dtype, pd.CategoricalDtype)
+    assert str(df["net"].dtype) == "Int64"
+
+
+def test_collect_t86_sums_do_not_overflow(monkeypatch):
+    fields = ["證券代號", "外資及陸資(不含外資自營商)買進股數", "外資自營商買進股數"]
+
+    def fake_records(date, **kwargs):
+        return [["2330", "30,000", "30,000"]], fields
+
+    monkeypatch.setattr(institutional_fetcher, "fetch_t86_records", fake_records)
+    t86 = institutional_fetcher.collect_t86([dt.date(2025, 1, 2)])
+    assert str(t86["foreign_buy"].dtype) == "Int64"
+    assert (t86["foreign_buy"] + t86["foreign_dealer_buy"]).tolist() == [60000]
+
+
+def test_normalize_codes_strips_and_keeps_leading_zeros():
+    df = pd.DataFrame({"code": [" 0050", "2330 "]})
+    normalize_codes(df)
+    assert df["code"].tolist() == ["0050", "2330"]
+    assert normalize_codes(pd.DataFrame({"x": [1]}))["x"].tolist() == [1]
@@ -0,0 +1,16 @@
+import datetime as dt
+from stock_data_fetcher.twse_api import records_to_frame
+
+def test_records_to_frame_repeats_dates_per_row():
+    d1, d2, d3 = dt.date(2025, 1, 2), dt.date(2025, 1, 3), dt.date(2025, 1, 6)
+    fields = ["證券代號", "三大法人買賣超股數"]
+    df = records_to_frame([
+        (d1, ([["2330", "1"], ["2317", "2"]], fields)),
+        (d2, None),
+        (d3, ([["2330", "3"]], fields)),
+    ])
+    assert df["證券代號"].tolist() == ["2330", "2317", "2330"]
+    assert [t.date() for t in df["date"]] == [d1, d1, d3]
+
+def test_records_to_frame_empty():
+    assert records_to_frame([(dt.date(2025, 1, 2), None)]).empty
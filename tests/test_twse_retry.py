@@ -0,0 +1,23 @@
+from urllib3.util.retry import RequestHistory
+import stock_data_fetcher.twse_api as api
+
+def _retry(retry=3, retry_wait=2):
+    return api._build_session(retry, retry_wait).get_adapter("https://www.twse.com.tw").max_retries
+
+def test_session_adapter_retries_rate_limits_and_server_errors_only():
+    retry = _retry()
+    assert retry.total == 3
+    assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+    assert retry.respect_retry_after_header
+    assert retry.is_retry("GET", 429)
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("GET", 404)
+    assert not retry.is_retry("GET", 400)
+
+def test_first_retry_waits_retry_wait():
+    def after(n):
+        history = tuple(RequestHistory("GET", "/", None, 429, None) for _ in range(n))
+        return _retry().new(history=history).get_backoff_time()
+    assert 2 <= after(1) < 2.5
+    assert 4 <= after(2) < 4.5
+    assert 8 <= after(3) < 8.5
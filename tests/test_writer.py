@@ -0,0 +1,27 @@
+import datetime as dt
+import pandas as pd
+import pytest
+from stock_data_fetcher.writer import write_symbol_frames
+from stock_data_fetcher.exceptions import OutputError
+
+def _frame():
+    idx = pd.DatetimeIndex(pd.to_datetime(["2025-01-02", "2025-01-03"]), name="Date")
+    cols = pd.MultiIndex.from_product([["2330.TW", "AAPL"], ["Close", "Volume"]])
+    return pd.DataFrame([[1.5, 10, 2.5, 20], [1.6, 11, 2.6, 21]], index=idx, columns=cols)
+
+def test_write_symbol_frames_csv(tmp_path):
+    written = write_symbol_frames(_frame(), ["2330.TW", "MISSING"], tmp_path, dt.date(2025, 1, 2), None)
+    assert [p.name for p in written] == ["2330.TW_20250102_latest.csv"]
+    assert written[0].read_text().splitlines()[:2] == ["Date,Close,Volume", "2025-01-02,1.5,10"]
+
+def test_write_symbol_frames_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    written = write_symbol_frames(_frame(), ["AAPL"], tmp_path, dt.date(2025, 1, 2), None, file_format="parquet")
+    back = pd.read_parquet(written[0])
+    assert back["Volume"].tolist() == [20, 21]
+
+def test_write_symbol_frames_keeps_symbol_order_and_raises_output_error(tmp_path):
+    written = write_symbol_frames(_frame(), ["AAPL", "2330.TW"], tmp_path, dt.date(2025, 1, 2), None)
+    assert [p.name for p in written] == ["AAPL_20250102_latest.csv", "2330.TW_20250102_latest.csv"]
+    with pytest.raises(OutputError):
+        write_symbol_frames(_frame(), ["AAPL"], tmp_path, dt.date(2025, 1, 2), None, file_format="xlsx")